@@ -3,18 +3,18 @@ __author__ = "Myron Walker"
 __copyright__ = "Copyright 2023, Myron W Walker"
 __credits__ = []
 
-from typing import Optional
+from typing import Optional, Tuple
 
-import json
+import hashlib
 import logging
+import orjson
 import requests
-import os
+import socket
 import threading
-import time
-import traceback
 
-from socketserver import _AfInetAddress, ThreadingMixIn
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from concurrent.futures import ThreadPoolExecutor
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
 
 from mojo.results.model.forwardinginfo import ForwardingInfo
 from mojo.results.model.progressinfo import ProgressInfo
@@ -22,58 +22,143 @@ from mojo.results.model.progressinfo import ProgressInfo
 from mojo.results.recorders.resultrecorder import ResultRecorder
 
 
-class ProgressCallbackHandler(SimpleHTTPRequestHandler):
+MAX_CALLBACK_BODY = 16 * 1024 * 1024
+
+MAX_FORWARDING_BACKOFF = 300
+
+
+class ProgressCallbackHandler(BaseHTTPRequestHandler):
     """
-        The :class:`ResultConcentratorService` 
+        The :class:`ResultConcentratorService`
     """
 
+    # The concentrator only accepts progress postbacks, so the file serving machinery of
+    # SimpleHTTPRequestHandler is not needed.  Speak HTTP/1.1 so remote posters can keep
+    # their connections alive between callbacks, and time out idle connections so parked
+    # keep-alive clients do not hold pool workers indefinitely.
+    protocol_version = "HTTP/1.1"
+    timeout = 60
+
     def do_POST(self):
 
         errmsg = None
 
-        if 'content-length' in self.headers:
+        length = int(self.headers.get("Content-Length") or 0)
 
-            content_length = self.headers["content-length"]
-            length = int(content_length) if content_length else 0
+        if length > MAX_CALLBACK_BODY:
+            # Reject over-sized payloads before reading anything from the stream.  The
+            # unread body would be parsed as the next request line on a keep-alive
+            # connection, so close it, and send an explicit zero Content-Length so the
+            # client can delimit the response without waiting on the handler timeout.
+            self.close_connection = True
+            self.send_response(413, message=None)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
 
-            if length:
-                try:
-                    content = self.rfile.read(length)
-                    
-                    data = json.loads(content)
-
-                    progress = ProgressInfo.from_dict(data)
-                    server: ProgressConcentratorServer = self.server
-                    
-                    server.update_task_progress(progress)
-
-                except Exception as perr:
-                    errmsg_msg_lines = [
-                        "Error processing progress postback.",
-                        "EXCEPTION:",
-                        traceback.format_exc()
-                    ]
-                    errmsg = os.linesep.join(errmsg_msg_lines)
+        if length:
+            try:
+                # Read the body directly into a preallocated buffer and hand the buffer
+                # to the parser, avoiding the intermediate copies made by rfile.read.
+                buffer = bytearray(length)
+                view = memoryview(buffer)
+
+                nread = 0
+                while nread < length:
+                    rcount = self.rfile.readinto(view[nread:])
+                    if not rcount:
+                        break
+                    nread += rcount
+
+                server: ProgressConcentratorServer = self.server
+
+                server.update_task_progress_raw(view[:nread])
+
+            except Exception:
+                # Keep the response message short and let the logging handler format
+                # the traceback, which costs nothing when the logger is disabled.
+                errmsg = "Error processing progress postback."
+                self.server._logger.exception(errmsg)
 
         if not errmsg:
             self.send_response(200, message=None)
-            self.send_header("Content-Type", "text/html")
         else:
             self.send_response(500, message=errmsg)
-            self.send_header("Content-Type", "text/html")
-        
+
+        # The response has no body, the headers buffer here and flush as a single write.
+        self.send_header("Content-Length", "0")
         self.end_headers()
 
         return
 
+    def log_message(self, format, *args):
+        # The default implementation writes an access log line to stderr for every request,
+        # which is a synchronous write per callback.  Route it through the logging framework
+        # at debug level so high callback rates don't pay for logging that nobody reads.
+        self.server._logger.debug("%s - - %s", self.address_string(), format % args)
+        return
+
 
-class ProgressConcentratorServer(ThreadingMixIn, HTTPServer):
+class ThreadPoolMixIn:
+    """
+        Mix-in class to handle each request in a fixed-size pool of worker threads.  Progress
+        callbacks are short-lived requests, so spawning a fresh OS thread per request costs more
+        than the handler itself and leaves concurrency unbounded under bursts.  A small pool
+        amortizes the thread creation and queues surges instead.
+    """
+
+    pool_max_workers = 16
+
+    _request_pool = None
+    _active_requests = None
+
+    def process_request(self, request, client_address):
+        if self._request_pool is None:
+            self._request_pool = ThreadPoolExecutor(max_workers=self.pool_max_workers,
+                                                    thread_name_prefix='concentrator-worker')
+            self._active_requests = set()
+        self._request_pool.submit(self.process_request_thread, request, client_address)
+        return
+
+    def process_request_thread(self, request, client_address):
+        self._active_requests.add(request)
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self._active_requests.discard(request)
+            self.shutdown_request(request)
+        return
+
+    def shutdown_pool(self):
+        """
+            Releases the worker pool and force-closes any connections the workers are
+            parked on.  The pool threads are non-daemon, so without this a worker sitting
+            in a keep-alive read pins interpreter exit until the handler timeout expires.
+        """
+        if self._request_pool is not None:
+            self._request_pool.shutdown(wait=False, cancel_futures=True)
+            for request in list(self._active_requests):
+                # A full SHUT_RDWR is required here; the SHUT_WR that shutdown_request
+                # performs leaves a worker blocked in its keep-alive read.
+                try:
+                    request.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+        return
+
+
+class ProgressConcentratorServer(ThreadPoolMixIn, HTTPServer):
     """
         The :class:`ResultConcentratorServer` runs a web server for the purpose of receiving and concentrating result
         callbacks from remote tasks or processes.
     """
 
-    def __init__(self, recorder: ResultRecorder, server_address: _AfInetAddress, forwarding_info: Optional[ForwardingInfo] = None,
+    # Give the listen backlog room to absorb connection spikes while the worker pool drains.
+    request_queue_size = 128
+
+    def __init__(self, recorder: ResultRecorder, server_address: Tuple[str, int], forwarding_info: Optional[ForwardingInfo] = None,
                 bind_and_activate: bool = True) -> None:
 
         self._recorder = recorder
@@ -82,10 +167,24 @@ class ProgressConcentratorServer(ThreadingMixIn, HTTPServer):
         super().__init__(server_address, ProgressCallbackHandler, bind_and_activate)
 
         self._forward_thread = None
-        self._forwarding_running = False
+
+        # The forwarding loop posts to a single endpoint for the life of the server, so keep
+        # the connection alive between intervals instead of re-establishing it per post.
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # The forwarding headers are fixed for the life of the server, so install them as
+        # session defaults once instead of having every post merge a headers dict.
+        self._session.headers["Content-Type"] = "application/json"
+        if self._forwarding_info is not None and self._forwarding_info.forwarding_headers is not None:
+            self._session.headers.update(self._forwarding_info.forwarding_headers)
 
         self._server_thread = None
-        self._server_running = False
+        self._server_running = threading.Event()
+
+        self._shutdown_event = threading.Event()
 
         self._logger = logging.getLogger()
 
@@ -98,70 +197,93 @@ class ProgressConcentratorServer(ThreadingMixIn, HTTPServer):
         """
         
         if self._forwarding_info is not None:
-            fwd_gate = threading.Event()
-            fwd_gate.clear()
-            
-            self._forward_thread = threading.Thread(target=self._forwarding_thread_entry, name='prog-forwarder', args=(fwd_gate,), daemon=True)
+            fwd_barrier = threading.Barrier(2)
+
+            self._forward_thread = threading.Thread(target=self._forwarding_thread_entry, name='prog-forwarder', args=(fwd_barrier,), daemon=True)
             self._forward_thread.start()
 
-            fwd_gate.wait()
+            fwd_barrier.wait()
 
-        svr_gate = threading.Event()
-        svr_gate.clear()
+        svr_barrier = threading.Barrier(2)
 
-        self._server_running = True
-        
-        self._server_thread = threading.Thread(target=self._service_thread_entry, name='prog-concentrator', args=(svr_gate,), daemon=True)
+        self._server_running.set()
+
+        self._server_thread = threading.Thread(target=self._service_thread_entry, name='prog-concentrator', args=(svr_barrier,), daemon=True)
         self._server_thread.start()
 
-        svr_gate.wait()
+        svr_barrier.wait()
 
         return
     
-    def _forwarding_thread_entry(self, start_gate: threading.Event):
-        
-        self._forwarding_running
+    def shutdown(self):
+        """
+            Stops the server request accept loop and the forwarding loop.
+        """
+        self._server_running.clear()
+
+        self._shutdown_event.set()
 
-        headers = {
-            "Content-Type": "application/json"
-        }
+        super().shutdown()
+
+        self.shutdown_pool()
+
+        return
+
+    def _forwarding_thread_entry(self, start_barrier: threading.Barrier):
 
         forwarding_interval = self._forwarding_info.forwarding_interval
         forwarding_url = self._forwarding_info.forwarding_url
-        forwarding_headers = self._forwarding_info.forwarding_headers
 
-        if forwarding_headers is not None:
-            headers.update(forwarding_headers)
+        start_barrier.wait()
+
+        last_digest = None
+        consecutive_failures = 0
 
-        start_gate.set()
+        while not self._shutdown_event.is_set():
 
-        while self._forwarding_running:
+            wait_interval = forwarding_interval
 
             try:
                 summary = self._recorder.summary
 
-                requests.post(forwarding_url, json=summary, headers=headers)
+                body = orjson.dumps(summary)
 
-                time.sleep(forwarding_interval)
+                # Only post the summary when it has changed since the last interval.
+                digest = hashlib.blake2b(body, digest_size=8).digest()
+                if digest != last_digest:
+                    self._session.post(forwarding_url, data=body)
+                    last_digest = digest
+
+                consecutive_failures = 0
 
             except Exception:
-                errmsg = traceback.format_exc()
-                self._logger.error(errmsg)
+                # Defer the traceback formatting to the logging handler, and back off
+                # exponentially so a prolonged outage is not hammered every interval.
+                self._logger.exception("Progress summary forwarding failed.")
+
+                consecutive_failures += 1
+                wait_interval = min(MAX_FORWARDING_BACKOFF, forwarding_interval * (2 ** consecutive_failures))
+
+            # Park on the shutdown event rather than sleeping so a stop request
+            # unblocks the loop immediately instead of after a full interval.
+            self._shutdown_event.wait(timeout=wait_interval)
 
         return
 
-    def _service_thread_entry(self, start_gate: threading.Event):
-        
-        self._server_running = True
+    def _service_thread_entry(self, start_barrier: threading.Barrier):
 
-        start_gate.set()
+        start_barrier.wait()
 
         self.serve_forever()
 
         return
 
     def update_task_progress(self, progress: ProgressInfo):
-        self._recorder.post_task_progress(progress)
+        self._recorder.post_task_progress([progress])
+        return
+
+    def update_task_progress_raw(self, payload: bytes):
+        self._recorder.post_task_progress_raw(payload)
         return
 
 
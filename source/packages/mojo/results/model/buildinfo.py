@@ -16,7 +16,7 @@ __credits__ = []
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildInfo:
 
     branch: str # name of a code 'branch' to associate with the results.
@@ -18,7 +18,7 @@ from typing import Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ForwardingInfo:
 
     forwarding_interval: float # The interval in seconds to use when forwarding job summary information
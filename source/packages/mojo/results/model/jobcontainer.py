@@ -20,6 +20,9 @@ class JobContainer(ResultContainer):
         The :class:`JobContainer` instances are container nodes that are used to link result nodes in the
         result tree.  The :class:`JobContainer` node is the base node for the tree.
     """
+
+    __slots__ = ()
+
     def __init__(self, inst_id: str, name: str):
         """
             Creates an instance of a result container.
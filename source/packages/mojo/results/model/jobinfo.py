@@ -17,7 +17,7 @@ from typing import Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class JobInfo:
 
     id: str # identifier for a job from the runner perspective
@@ -15,7 +15,7 @@ __credits__ = []
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineInfo:
 
     id: str # identifier such as a uuid which identifies a particular venue associated with the pipeline.
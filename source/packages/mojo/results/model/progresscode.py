@@ -15,3 +15,4 @@ class ProgressCode(str, Enum):
     NotStarted = "NotStarted"
     Paused = "Paused"
     Running = "Running"
+    Starting = "Starting"
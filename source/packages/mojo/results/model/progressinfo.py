@@ -15,15 +15,23 @@ __credits__ = []
 from typing import Optional
 
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
+import orjson
+
 
 from mojo.results.model.progresscode import ProgressCode
 from mojo.results.model.progresstype import ProgressType
 
 
-@dataclass
+# Member maps for converting inbound string values back into enum members with a single
+# dict lookup instead of going through the EnumMeta call protocol on every postback.
+_PTYPE_BY_NAME = {m.value: m for m in ProgressType}
+_PCODE_BY_NAME = {m.value: m for m in ProgressCode}
+
+
+@dataclass(frozen=True, slots=True)
 class ProgressInfo:
 
     id: str
@@ -37,33 +45,53 @@ class ProgressInfo:
     when: datetime
     data: Optional[dict] = None
 
+    # A ProgressInfo instance is an immutable snapshot, so its serialized forms are computed
+    # once on first use and cached for any repeat serialization of the same snapshot.
+    _dict_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    _json_cache: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+
     def as_dict(self) -> dict:
 
-        rtnval = {
-            "id": self.id,
-            "category": self.category,
-            "moniker": self.moniker,
-            "ptype": self.ptype.name,
-            "range_min": self.range_min,
-            "range_max": self.range_max,
-            "position": self.position,
-            "status": self.status.name,
-            "when": self.when.isoformat()
-        }
-
-        if self.data is not None:
-            rtnval["data"] = self.data
-        else:
-            rtnval["data"] = {}
+        rtnval = self._dict_cache
+
+        if rtnval is None:
+            rtnval = {
+                "id": self.id,
+                "category": self.category,
+                "moniker": self.moniker,
+                "ptype": self.ptype.name,
+                "range_min": self.range_min,
+                "range_max": self.range_max,
+                "position": self.position,
+                "status": self.status.name,
+                "when": self.when.isoformat(),
+                "data": self.data if self.data is not None else {}
+            }
+
+            object.__setattr__(self, "_dict_cache", rtnval)
+
+        return rtnval
+
+    def as_json(self) -> bytes:
+
+        rtnval = self._json_cache
+
+        if rtnval is None:
+            rtnval = orjson.dumps(self.as_dict())
+
+            object.__setattr__(self, "_json_cache", rtnval)
 
         return rtnval
     
     @classmethod
-    def from_dict(data: dict) -> "ProgressInfo":
+    def from_dict(cls, data: dict) -> "ProgressInfo":
         when = datetime.fromisoformat(data["when"])
 
-        inst = ProgressInfo(data["id"], data["category"], data["moniker"], data["ptype"], data["range_min"],
-                            data["range_max"], data["position"], data["status"], when, data["data"])
+        ptype = _PTYPE_BY_NAME[data["ptype"]]
+        status = _PCODE_BY_NAME[data["status"]]
+
+        inst = cls(data["id"], data["category"], data["moniker"], ptype, data["range_min"],
+                   data["range_max"], data["position"], status, when, data["data"])
         return inst
     
     def __repr__(self):
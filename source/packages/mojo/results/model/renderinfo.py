@@ -14,7 +14,7 @@ __credits__ = []
 
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class RenderInfo:
 
     title: str # A title to associated with the summary for the test results.
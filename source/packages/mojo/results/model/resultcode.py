@@ -1,7 +1,7 @@
 """
-.. module:: resulttype
+.. module:: resultcode
     :platform: Darwin, Linux, Unix, Windows
-    :synopsis: Module containing the :class:`ResultType` enumeration used to mark the result code
+    :synopsis: Module containing the :class:`ResultCode` enumeration used to mark the result code
                for a leaf/task node.
 
 .. moduleauthor:: Myron Walker <myron.walker@gmail.com>
@@ -25,3 +25,8 @@ class ResultCode(IntEnum):
     FAILED = 4
     CANCELLED = 5
     UNKOWN = 6
+
+
+# The serializers read member names constantly; a flat tuple indexed by the enum value is
+# a C-level lookup where the .name descriptor costs a Python-level call per access.
+RESULT_CODE_NAMES = tuple(m.name for m in ResultCode)
@@ -14,10 +14,9 @@ __credits__ = []
 
 from typing import Optional
 
-import collections
-import json
+import orjson
 
-from mojo.results.model.resulttype import ResultType
+from mojo.results.model.resulttype import ResultType, RESULT_TYPE_NAMES
 
 class ResultContainer:
     """
@@ -25,6 +24,9 @@ class ResultContainer:
         result tree.  The :class:`ResultContainer` nodes do not contain result data but link data so the data can
         be computed on demand.
     """
+
+    __slots__ = ("_inst_id", "_name", "_result_type", "_parent_inst", "_as_dict_cache")
+
     def __init__(self, inst_id: str, name: str, result_type: ResultType, parent_inst: Optional[str] = None):
         """
             Creates an instance of a result container.
@@ -40,6 +42,15 @@ class ResultContainer:
         self._name = name
         self._result_type = result_type
         self._parent_inst = parent_inst
+
+        # The container fields are fixed at construction, so the dict form can be built
+        # once up front instead of on every serialization pass over the result tree.
+        self._as_dict_cache = {
+            "name": self._name,
+            "instance": self._inst_id,
+            "parent": self._parent_inst,
+            "rtype": RESULT_TYPE_NAMES[self._result_type]
+        }
         return
 
     @property
@@ -70,18 +81,11 @@ class ResultContainer:
         """
         return self._result_type
 
-    def as_dict(self, is_preview: bool = False) -> collections.OrderedDict:
+    def as_dict(self, is_preview: bool = False) -> dict:
         """
-            Converts the result container instance to an :class:`collections.OrderedDict` object.
+            Converts the result container instance to a :class:`dict` object.
         """
-        rcinfo = collections.OrderedDict([
-            ("name", self._name),
-            ("instance", self._inst_id),
-            ("parent", self._parent_inst),
-            ("rtype", self._result_type.name)
-        ])
-
-        return rcinfo
+        return self._as_dict_cache
 
     def to_json(self, is_preview: bool = False) -> str:
         """
@@ -89,6 +93,6 @@ class ResultContainer:
         """
         rcinfo = self.as_dict(is_preview=is_preview)
 
-        rcstr = json.dumps(rcinfo, indent=4)
+        rcstr = orjson.dumps(rcinfo, option=orjson.OPT_INDENT_2).decode("utf-8")
 
         return rcstr
\ No newline at end of file
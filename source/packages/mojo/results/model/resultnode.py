@@ -13,20 +13,36 @@ __credits__ = []
 
 
 
-from typing import List
+from typing import Iterable, List
 
-import collections
-import json
+import time
+
+import orjson
 
 from datetime import datetime
 
-from dataclasses import asdict as dataclass_as_dict
 
 from mojo.errors.xtraceback import TracebackDetail
-from mojo.results.model.resultcode import ResultCode
-from mojo.results.model.resulttype import ResultType
+from mojo.results.model.resultcode import ResultCode, RESULT_CODE_NAMES
+from mojo.results.model.resulttype import ResultType, RESULT_TYPE_NAMES
+
+from mojo.results.utilities import format_datetime_with_fractional_cached
+
+
+# Shared sentinel for nodes that never accumulate errors, failures or warnings, which is
+# the common case; a real list is only allocated on the first add.
+_EMPTY = ()
+
+
+def _json_default(obj):
+    # The TracebackDetail dataclasses are serialized natively by orjson, so this hook only
+    # has to cover remaining model values, such as tasking return values, that expose an
+    # as_dict conversion rather than being directly encodable.
+    as_dict = getattr(obj, "as_dict", None)
+    if as_dict is not None:
+        return as_dict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
 
-from mojo.xmods.xdatetime import format_datetime_with_fractional
 
 class ResultNode:
     """
@@ -35,6 +51,10 @@ class ResultNode:
         does not contain results that can be computed by analyzing the relationship of the nodes in the tree.  The nodes that are
         computed are :class:`ResultContainer` instances and do not contain instance result data.
     """
+
+    __slots__ = ("_inst_id", "_name", "_parent_inst", "_result_type", "_result_code",
+                 "_start", "_stop", "_errors", "_failures", "_warnings", "_docstr")
+
     def __init__(self, inst_id: str, name: str, parent_inst: str, result_type: ResultType, result_code: ResultCode = ResultCode.UNSET):
         """
             Initializes an instance of a :class:`ResultNode` object that represent the information associated with
@@ -46,20 +66,20 @@ class ResultNode:
             :param result_type: The type :class:`ResultType` type code of result container.
             :param result_code: The result code to initialize the result node to.
         """
-        super().__init__()
-
         self._inst_id = inst_id
         self._name = name
         self._parent_inst = parent_inst
         self._result_type = result_type
         self._result_code = result_code
 
-        self._start = datetime.now()
+        # Timestamps are kept as raw time.time() floats, a single vDSO call, and are only
+        # converted into datetime objects at the read and serialization boundaries.
+        self._start = time.time()
         self._stop = None
         
-        self._errors = []
-        self._failures = []
-        self._warnings = []
+        self._errors = _EMPTY
+        self._failures = _EMPTY
+        self._warnings = _EMPTY
         
         self._docstr = None
         return
@@ -122,11 +142,14 @@ class ResultNode:
     
     @property
     def start(self) -> datetime:
-        return self._start
-    
+        return datetime.fromtimestamp(self._start)
+
     @property
     def stop(self) -> datetime:
-        return self._stop
+        rtnval = None
+        if self._stop is not None:
+            rtnval = datetime.fromtimestamp(self._stop)
+        return rtnval
 
     @property
     def warnings(self) -> List[str]:
@@ -139,6 +162,8 @@ class ResultNode:
         """
             Adds error trace lines for a single error to this result node.
         """
+        if self._errors is _EMPTY:
+            self._errors = []
         self._errors.append(trace_detail)
         return
 
@@ -146,6 +171,8 @@ class ResultNode:
         """
             Adds failure trace lines for a single failure to this result node.
         """
+        if self._failures is _EMPTY:
+            self._failures = []
         self._failures.append(trace_detail)
         return
 
@@ -153,14 +180,13 @@ class ResultNode:
         """
             Adds warning trace lines for a single warning to this result node.
         """
+        # splitlines handles all of the universal newline forms in a single C-level pass,
+        # so there is no need for the per-line CRLF replace and find/split dance.
         trim_lines = []
         for nline in warn_lines:
-            nline = nline.rstrip().replace("\r\n", "\n")
-            if nline.find("\n") > -1:
-                split_lines = nline.split("\n")
-                trim_lines.extend(split_lines)
-            else:
-                trim_lines.append(nline)
+            trim_lines.extend(nline.rstrip().splitlines() or [""])
+        if self._warnings is _EMPTY:
+            self._warnings = []
         self._warnings.append(trim_lines)
         return
 
@@ -169,11 +195,11 @@ class ResultNode:
             Finalizes the :class:`ResultCode` code for this result node based on whether
             there were any errors or failures added to the node.
         """
-        self._stop = datetime.now()
+        self._stop = time.time()
 
-        if len(self._failures) > 0:
+        if self._failures:
             self._result_code = ResultCode.FAILED
-        elif len(self._errors) > 0:
+        elif self._errors:
             self._result_code = ResultCode.ERRORED
         elif self._result_code == ResultCode.UNSET or self._result_code == ResultCode.PASSED:
             self._result_code = ResultCode.PASSED
@@ -196,38 +222,56 @@ class ResultNode:
         self._docstr = docstr
         return
 
-    def as_dict(self, is_preview: bool = False) -> collections.OrderedDict:
+    def _base_dict(self) -> dict:
         """
-            Converts the result node instance to an :class:`collections.OrderedDict` object.
+            Builds the base dict form shared by the preview and full serializations.
         """
 
-        start_datetime = format_datetime_with_fractional(self._start)
+        start_datetime = format_datetime_with_fractional_cached(self.start)
 
         stop_datetime = ""
-        if self._stop is not None:
-            stop_datetime = format_datetime_with_fractional(self._stop)
-
-        rninfo = collections.OrderedDict([
-            ("name", self._name),
-            ("instance", self._inst_id),
-            ("parent", self._parent_inst),
-            ("rtype", self._result_type.name),
-            ("result", self._result_code.name),
-            ("start", start_datetime),
-            ("stop", stop_datetime)
-        ])
-
-        if not is_preview:
-            errors = [dataclass_as_dict(e) for e in self._errors]
-            failures = [dataclass_as_dict(f) for f in self._failures]
-
-            detail_items = [
-                ("errors", errors),
-                ("failures", failures),
-                ("warnings", self._warnings)
-            ]
-
-            detail = collections.OrderedDict(detail_items)
+        stop = self.stop
+        if stop is not None:
+            stop_datetime = format_datetime_with_fractional_cached(stop)
+
+        rninfo = {
+            "name": self._name,
+            "instance": self._inst_id,
+            "parent": self._parent_inst,
+            "rtype": RESULT_TYPE_NAMES[self._result_type],
+            "result": RESULT_CODE_NAMES[self._result_code],
+            "start": start_datetime,
+            "stop": stop_datetime
+        }
+
+        return rninfo
+
+    def as_preview_dict(self) -> dict:
+        """
+            Converts the result node instance to its preview :class:`dict` form, which carries
+            no detail section.  Polling callers that only want node status should prefer this
+            over as_dict(is_preview=True).
+        """
+        return self._base_dict()
+
+    def as_dict(self, is_preview: bool = False) -> dict:
+        """
+            Converts the result node instance to a :class:`dict` object.
+        """
+
+        rninfo = self._base_dict()
+
+        # The common case is a clean node with nothing to detail, so only pay for the
+        # detail dict when there is actually something to put in it.
+        if not is_preview and (self._errors or self._failures or self._warnings or self._docstr is not None):
+            # The errors and failures are TracebackDetail dataclasses which orjson walks
+            # natively, so there is no need to pre-convert them with dataclasses.asdict,
+            # which deep-copies every field of every trace frame.
+            detail = {
+                "errors": self._errors,
+                "failures": self._failures,
+                "warnings": self._warnings
+            }
 
             if self._docstr is not None:
                 detail["documentation"] =  self._docstr
@@ -236,12 +280,37 @@ class ResultNode:
 
         return rninfo
 
+    @classmethod
+    def serialize_many(cls, nodes: Iterable["ResultNode"], is_preview: bool = False) -> bytes:
+        """
+            Serializes a batch of result nodes with a single encoder call.  Report generation
+            that serializes a whole tree should prefer this over per-node to_json calls, since
+            one orjson pass amortizes the buffer growth and UTF-8 work across the payload.
+
+            :param nodes: The result nodes to serialize.
+            :param is_preview: Indicates the nodes should be serialized in preview form.
+
+            :returns: The encoded JSON bytes for the list of nodes.
+        """
+        payload = [node.as_dict(is_preview=is_preview) for node in nodes]
+
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2, default=_json_default)
+
     def to_json(self, is_preview: bool = False) -> str:
         """
             Converts the result node instance to JSON format.
         """
+        rnstr = self.to_json_bytes(is_preview=is_preview).decode("utf-8")
+
+        return rnstr
+
+    def to_json_bytes(self, is_preview: bool = False) -> bytes:
+        """
+            Converts the result node instance to encoded JSON bytes.  Binary record streams
+            should prefer this over to_json, which pays a decode for the str boundary.
+        """
         rninfo = self.as_dict(is_preview=is_preview)
 
-        rnstr = json.dumps(rninfo, indent=4)
+        rnbytes = orjson.dumps(rninfo, option=orjson.OPT_INDENT_2, default=_json_default)
 
-        return rnstr
+        return rnbytes
@@ -30,3 +30,8 @@ class ResultType(IntEnum):
     STEP = 8
     TASKING_GROUP = 9
     TASKING = 10
+
+
+# The serializers read member names constantly; a flat tuple indexed by the enum value is
+# a C-level lookup where the .name descriptor costs a Python-level call per access.
+RESULT_TYPE_NAMES = tuple(m.name for m in ResultType)
@@ -1,5 +1,5 @@
 """
-.. module:: taskgroup
+.. module:: taskinggroup
     :platform: Darwin, Linux, Unix, Windows
     :synopsis: Module containing the :class:`TaskingGroup` object used to serve as a
                tree node group for a group of tasks.
@@ -13,14 +13,15 @@ __credits__ = []
 
 
 
-import collections
+
+import time
 
 from datetime import datetime
 
-from mojo.results.model.resulttype import ResultType
+from mojo.results.model.resulttype import ResultType, RESULT_TYPE_NAMES
 from mojo.results.model.resultcontainer import ResultContainer
 
-from mojo.xmods.xdatetime import format_datetime_with_fractional
+from mojo.results.utilities import format_datetime_with_fractional_cached
 
 
 class TaskingGroup(ResultContainer):
@@ -29,6 +30,9 @@ class TaskingGroup(ResultContainer):
         result tree.  The :class:`TaskingGroup` nodes do not contain result data but link data so the data can
         be computed on demand.
     """
+
+    __slots__ = ("_start", "_stop")
+
     def __init__(self, inst_id: str, name: str, parent_inst: str):
         """
             Creates an instance of a result group.
@@ -39,7 +43,9 @@ class TaskingGroup(ResultContainer):
         """
         super().__init__(inst_id, name, ResultType.TASKING_GROUP, parent_inst=parent_inst)
 
-        self._start = datetime.now()
+        # Timestamps are kept as raw time.time() floats, a single vDSO call, and are only
+        # converted into datetime objects at the read and serialization boundaries.
+        self._start = time.time()
         self._stop = None
         return
 
@@ -48,37 +54,41 @@ class TaskingGroup(ResultContainer):
         """
             The start timestamp of the tasking group.
         """
-        return self._start
-    
+        return datetime.fromtimestamp(self._start)
+
     @property
     def stop(self):
         """
             The stop timestamp of the tasking group.
         """
-        return self._stop
+        rtnval = None
+        if self._stop is not None:
+            rtnval = datetime.fromtimestamp(self._stop)
+        return rtnval
 
     def finalize(self):
-        self._stop = datetime.now()
+        self._stop = time.time()
         return
 
-    def as_dict(self, is_preview: bool = False) -> collections.OrderedDict:
+    def as_dict(self, is_preview: bool = False) -> dict:
         """
-            Converts the result group instance to an :class:`collections.OrderedDict` object.
+            Converts the result group instance to a :class:`dict` object.
         """
 
-        start_datetime = format_datetime_with_fractional(self._start)
+        start_datetime = format_datetime_with_fractional_cached(self.start)
 
         stop_datetime = ""
-        if self._stop is not None:
-            stop_datetime = format_datetime_with_fractional(self._stop)
-
-        rcinfo = collections.OrderedDict([
-            ("name", self._name),
-            ("instance", self._inst_id),
-            ("parent", self._parent_inst),
-            ("rtype", self._result_type.name),
-            ("start", start_datetime),
-            ('stop', stop_datetime)
-        ])
+        stop = self.stop
+        if stop is not None:
+            stop_datetime = format_datetime_with_fractional_cached(stop)
+
+        rcinfo = {
+            "name": self._name,
+            "instance": self._inst_id,
+            "parent": self._parent_inst,
+            "rtype": RESULT_TYPE_NAMES[self._result_type],
+            "start": start_datetime,
+            "stop": stop_datetime
+        }
 
         return rcinfo
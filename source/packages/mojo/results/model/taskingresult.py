@@ -1,7 +1,7 @@
 """
-.. module:: tasknode
+.. module:: taskingresult
     :platform: Darwin, Linux, Unix, Windows
-    :synopsis: Module containing the :class:`ResultNode` object used to serve as a
+    :synopsis: Module containing the :class:`TaskingResult` object used to serve as a
                tree leaf task node.
 
 .. moduleauthor:: Myron Walker <myron.walker@gmail.com>
@@ -15,10 +15,11 @@ __credits__ = []
 
 from typing import Any, List, Optional, Protocol
 
-import collections
 import os
+import textwrap
+
+from collections import Counter
 
-from dataclasses import asdict as dataclass_as_dict
 
 from mojo.errors.exceptions import (
     TaskingGroupAssertionError,
@@ -30,12 +31,11 @@ from mojo.errors.xtraceback import (
 )
 
 
-from mojo.xmods.xdatetime import format_datetime_with_fractional
-from mojo.xmods.xformatting import indent_lines_list
+from mojo.results.utilities import format_datetime_with_fractional_cached
 
-from mojo.results.model.resultcode import ResultCode
+from mojo.results.model.resultcode import ResultCode, RESULT_CODE_NAMES
 from mojo.results.model.resultnode import ResultNode
-from mojo.results.model.resulttype import ResultType
+from mojo.results.model.resulttype import ResultType, RESULT_TYPE_NAMES
 
 
 
@@ -46,6 +46,9 @@ class TaskingResult(ResultNode):
         does not contain results that can be computed by analyzing the relationship of the nodes in the tree.  The nodes that are
         computed are :class:`TaskingGroup` instances and do not contain instance task data.
     """
+
+    __slots__ = ("_worker", "_prefix", "_rvalue", "_rvalue_asdict")
+
     def __init__(self, inst_id: str, name: str, parent_inst: str, worker: str, rvalue: Optional[Any] = None, 
                  result_code: ResultCode = ResultCode.UNSET, prefix: str="tasking"):
         """
@@ -64,7 +67,11 @@ class TaskingResult(ResultNode):
 
         self._worker = worker
         self._prefix = prefix
-        self._rvalue = None    
+
+        # The dict conversion capability of a return value never changes, so resolve it once
+        # when the value is attached instead of paying a hasattr probe per serialization.
+        self._rvalue = rvalue
+        self._rvalue_asdict = getattr(rvalue, "as_dict", None)
         return
 
     @property
@@ -93,48 +100,53 @@ class TaskingResult(ResultNode):
             Add a result to this tasking result.
         """
         self._rvalue = rvalue
+        self._rvalue_asdict = getattr(rvalue, "as_dict", None)
         return
 
-    def as_dict(self, is_preview: bool = False) -> collections.OrderedDict:
+    def _base_dict(self) -> dict:
         """
-            Converts the result node instance to an :class:`collections.OrderedDict` object.
+            Builds the base dict form shared by the preview and full serializations.
         """
 
-        start_datetime = format_datetime_with_fractional(self._start)
+        start_datetime = format_datetime_with_fractional_cached(self.start)
 
         stop_datetime = ""
-        if self._stop is not None:
-            stop_datetime = format_datetime_with_fractional(self._stop)
-
-        rninfo = collections.OrderedDict([
-            ("name", self._name),
-            ("instance", self._inst_id),
-            ("parent", self._parent_inst),
-            ("rtype", self._result_type.name),
-            ("result", self._result_code.name),
-            ("prefix", self._prefix),
-            ("worker", self._worker),
-            ("start", start_datetime),
-            ("stop", stop_datetime)
-        ])
-
-        if hasattr(self._rvalue, "as_dict"):
-            rninfo["rvalue"] = self._rvalue.as_dict()
-        else:
-            rninfo["rvalue"] = self._rvalue
+        stop = self.stop
+        if stop is not None:
+            stop_datetime = format_datetime_with_fractional_cached(stop)
+
+        rninfo = {
+            "name": self._name,
+            "instance": self._inst_id,
+            "parent": self._parent_inst,
+            "rtype": RESULT_TYPE_NAMES[self._result_type],
+            "result": RESULT_CODE_NAMES[self._result_code],
+            "prefix": self._prefix,
+            "worker": self._worker,
+            "start": start_datetime,
+            "stop": stop_datetime
+        }
+
+        rninfo["rvalue"] = self._rvalue_asdict() if self._rvalue_asdict is not None else self._rvalue
 
-        if not is_preview:
-            
-            errors = [dataclass_as_dict(e) for e in self._errors]
-            failures = [dataclass_as_dict(f) for f in self._failures]
+        return rninfo
 
-            detail_items = [
-                ("errors", errors),
-                ("failures", failures),
-                ("warnings", self._warnings)
-            ]
+    def as_dict(self, is_preview: bool = False) -> dict:
+        """
+            Converts the result node instance to a :class:`dict` object.
+        """
 
-            detail = collections.OrderedDict(detail_items)
+        rninfo = self._base_dict()
+
+        if not is_preview:
+
+            # orjson walks the TracebackDetail dataclasses natively, so store them directly
+            # rather than deep-copying them into dicts with dataclasses.asdict.
+            detail = {
+                "errors": self._errors,
+                "failures": self._failures,
+                "warnings": self._warnings
+            }
 
             if self._docstr is not None:
                 detail["documentation"] =  self._docstr
@@ -151,48 +163,54 @@ class TaskingResult(ResultNode):
 
 
 class TaskingResultFormatter(Protocol):
-    
+
     def __call__(self, result: TaskingResult) -> List[str]: ...
 
 
+# One template format produces the whole formatter header in a single allocation rather
+# than building eight separate f-strings per formatted result.
+_TASK_HEADER_TEMPLATE = (
+    "Task - {name} ({worker})\n"
+    "instance: {inst_id}\n"
+    "parent: {parent}\n"
+    "rtype: {rtype}\n"
+    "result: {result}\n"
+    "start: {start}\n"
+    "stop: {stop}\n"
+    "ERRORS:"
+)
+
+
 def default_tasking_result_formatter(result: TaskingResult) -> List[str]:
 
-    start_datetime = format_datetime_with_fractional(result.start)
+    start_datetime = format_datetime_with_fractional_cached(result.start)
 
     stop_datetime = ""
     if result.stop is not None:
-        stop_datetime = format_datetime_with_fractional(result.stop)
-
-    task_lines = [
-        f"Task - {result.name} ({result.worker})",
-        f"instance: {result.inst_id}",
-        f"parent: {result.parent_inst}",
-        f"rtype: {result.result_type.name}",
-        f"result: {result.result_code.name}",
-        f"start: {start_datetime}",
-        f"stop: {stop_datetime}",
-        f"ERRORS:"
-    ]
-
-    error_lines = []
-    for item in result.errors:
-        error_lines.extend(format_traceback_detail(item))
-        error_lines.append("")
-
-    error_lines = indent_lines_list(error_lines, level=1)
-
-    task_lines.extend(error_lines)
+        stop_datetime = format_datetime_with_fractional_cached(result.stop)
+
+    task_lines = _TASK_HEADER_TEMPLATE.format(
+        name=result.name,
+        worker=result.worker,
+        inst_id=result.inst_id,
+        parent=result.parent_inst,
+        rtype=RESULT_TYPE_NAMES[result.result_type],
+        result=RESULT_CODE_NAMES[result.result_code],
+        start=start_datetime,
+        stop=stop_datetime
+    ).split("\n")
+
+    # textwrap.indent prefixes the joined block in a single pass rather than paying an
+    # f-string format per line the way indent_lines_list does.
+    error_lines = [ln for item in result.errors for ln in (*format_traceback_detail(item), "")]
+    if error_lines:
+        task_lines.extend(textwrap.indent("\n".join(error_lines), "    ").split("\n"))
 
     task_lines.append("FAILURES:")
 
-    failure_lines = []
-    for item in result.failures:
-        failure_lines.extend(format_traceback_detail(item))
-        failure_lines.append("")
-
-    failure_lines = indent_lines_list(failure_lines, level=1)
-
-    task_lines.extend(failure_lines)
+    failure_lines = [ln for item in result.failures for ln in (*format_traceback_detail(item), "")]
+    if failure_lines:
+        task_lines.extend(textwrap.indent("\n".join(failure_lines), "    ").split("\n"))
 
     return task_lines
 
@@ -200,40 +218,43 @@ def default_tasking_result_formatter(result: TaskingResult) -> List[str]:
 def verify_tasking_results(results: List[TaskingResult], context_message: str, group_name: Optional[str] = None,
                            result_formatter: TaskingResultFormatter = default_tasking_result_formatter):
 
-    unknown_taskings = []
-    cancelled_taskings = []
-    errored_taskings = []
-    failed_taskings = []
-    passed_taskings = []
+    # Count the result codes in a single C-level pass; the bucket lists the error branches
+    # report on are only materialized when a branch actually triggers, so the common
+    # all-passed case allocates nothing.
+    counts = Counter(res._result_code for res in results)
 
     res: TaskingResult
 
-    for res in results:
-        if res.result_code == ResultCode.PASSED:
-            if len(res.errors) > 0 or len(res.failures) > 0:
+    if counts[ResultCode.PASSED] == len(results):
+        for res in results:
+            if res._errors or res._failures:
                 raise RuntimeError("We should never have an exception and a result code of 0.")
-            
-            passed_taskings.append(res)
-        elif res.result_code == ResultCode.ERRORED:
-            errored_taskings.append(res)
-        elif res.result_code == ResultCode.FAILED:
-            failed_taskings.append(res)
-        elif res.result_code == ResultCode.CANCELLED:
-            cancelled_taskings.append(res)
-        else:
-            unknown_taskings.append(res)
+        return
+
+    known_count = (counts[ResultCode.PASSED] + counts[ResultCode.ERRORED] +
+                   counts[ResultCode.FAILED] + counts[ResultCode.CANCELLED])
+
+    if known_count < len(results):
+        known_codes = (ResultCode.PASSED, ResultCode.ERRORED, ResultCode.FAILED, ResultCode.CANCELLED)
+        unknown_taskings = [res for res in results if res._result_code not in known_codes]
+    else:
+        unknown_taskings = []
+
+    cancelled_taskings = [res for res in results if res._result_code == ResultCode.CANCELLED] if counts[ResultCode.CANCELLED] else []
+    errored_taskings = [res for res in results if res._result_code == ResultCode.ERRORED] if counts[ResultCode.ERRORED] else []
+    failed_taskings = [res for res in results if res._result_code == ResultCode.FAILED] if counts[ResultCode.FAILED] else []
 
     if len(unknown_taskings) > 0:
         # We had taskings results of an unknown type so this condition needs to have
         # a runtime error as it should not happen
         err_msg_lines = [
-            f"Tasking group='{group_name}' had unknown results."
+            f"Tasking group='{group_name}' had unknown results.",
             "TASKINGS:"
         ]
 
-        for res in results:
+        for res in unknown_taskings:
             err_msg_lines.append(f"    TaskID: {res.inst_id}")
-        
+
         err_msg = os.linesep.join(err_msg_lines)
         raise TaskingGroupRuntimeError(err_msg)
 
@@ -241,11 +262,11 @@ def verify_tasking_results(results: List[TaskingResult], context_message: str, g
         # All of the tasking result states were of known type, but we had some cancelled
         # taskings, so raise the cancelled error.
         err_msg_lines = [
-            f"Tasking group='{group_name}' had cancelled tasks."
+            f"Tasking group='{group_name}' had cancelled tasks.",
             "CANCELLED TASKINGS:"
         ]
 
-        for res in results:
+        for res in cancelled_taskings:
             err_msg_lines.append(f"    TaskID: {res.inst_id}")
         
         err_msg = os.linesep.join(err_msg_lines)
@@ -255,15 +276,18 @@ def verify_tasking_results(results: List[TaskingResult], context_message: str, g
         # If we had any error tasks, we need to raise a non AssertionError based
         # exception
         err_msg_lines = [
-            f"Tasking group='{group_name}' encountered Non asserted errors."
+            f"Tasking group='{group_name}' encountered Non asserted errors.",
             "ERRORED TASKINGS:"
         ]
 
-        for res in results:
-            fmt_res_lines = result_formatter(res)
-            fmt_res_lines = indent_lines_list(fmt_res_lines, 1)
-            err_msg_lines.extend(fmt_res_lines)
-            err_msg_lines.append("")
+        # Flatten every formatted result into one block, indent the block in a single
+        # pass and join once, rather than indenting and splicing per result.
+        block_lines = []
+        for res in errored_taskings:
+            block_lines.extend(result_formatter(res))
+            block_lines.append("")
+
+        err_msg_lines.append(textwrap.indent("\n".join(block_lines), "    "))
 
         err_msg = os.linesep.join(err_msg_lines)
         raise TaskingGroupRuntimeError(err_msg)
@@ -273,12 +297,13 @@ def verify_tasking_results(results: List[TaskingResult], context_message: str, g
             context_message,
             "RESULTS:"
         ]
-        
-        for res in results:
-            fmt_res_lines = result_formatter(res)
-            fmt_res_lines = indent_lines_list(fmt_res_lines, 1)
-            err_msg_lines.extend(fmt_res_lines)
-            err_msg_lines.append("")
+
+        block_lines = []
+        for res in failed_taskings:
+            block_lines.extend(result_formatter(res))
+            block_lines.append("")
+
+        err_msg_lines.append(textwrap.indent("\n".join(block_lines), "    "))
 
         err_msg = os.linesep.join(err_msg_lines)
 
@@ -22,6 +22,9 @@ class TestContainer(ResultContainer):
         result tree.  The :class:`TestsContainer` nodes do not contain result data but link data so the data can
         be computed on demand.
     """
+
+    __slots__ = ()
+
     def __init__(self, inst_id: str, name: str, parent_inst: str):
         """
             Creates an instance of a result container.
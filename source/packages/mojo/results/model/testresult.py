@@ -15,15 +15,13 @@ __credits__ = []
 
 from typing import Any, Dict, List
 
-import collections
 
-from dataclasses import asdict as dataclass_as_dict
 
-from mojo.results.model.resultcode import ResultCode
+from mojo.results.model.resultcode import ResultCode, RESULT_CODE_NAMES
 from mojo.results.model.resultnode import ResultNode
-from mojo.results.model.resulttype import ResultType
+from mojo.results.model.resulttype import ResultType, RESULT_TYPE_NAMES
 
-from mojo.xmods.xdatetime import format_datetime_with_fractional
+from mojo.results.utilities import format_datetime_with_fractional_cached
 
 class TestResult(ResultNode):
     """
@@ -32,6 +30,9 @@ class TestResult(ResultNode):
         does not contain results that can be computed by analyzing the relationship of the nodes in the tree.  The nodes that are
         computed are :class:`ResultContainer` instances and do not contain instance result data.
     """
+
+    __slots__ = ("_monikers", "_pivots", "_reason", "_bug", "_base_info")
+
     def __init__(self, inst_id: str, name: str, parent_inst: str, monikers: List[str], pivots: Dict[str, Any], result_code: ResultCode = ResultCode.UNSET):
         """
             Initializes an instance of a :class:`ResultNode` object that represent the information associated with
@@ -50,6 +51,17 @@ class TestResult(ResultNode):
         self._pivots = pivots
         self._reason = None
         self._bug = None
+
+        # The identifying fields never change after construction, so the static fragment of
+        # the dict form is built once here and merged with the varying fields at emit time.
+        self._base_info = {
+            "name": name,
+            "monikers": monikers,
+            "pivots": pivots,
+            "instance": inst_id,
+            "parent": parent_inst,
+            "rtype": RESULT_TYPE_NAMES[ResultType.TEST]
+        }
         return
 
 
@@ -78,48 +90,50 @@ class TestResult(ResultNode):
         self._result_code = ResultCode.SKIPPED
         return
 
-    def as_dict(self, is_preview: bool = False) -> collections.OrderedDict:
+    def _base_dict(self) -> dict:
         """
-            Converts the result node instance to an :class:`collections.OrderedDict` object.
+            Builds the base dict form shared by the preview and full serializations.
         """
 
-        start_datetime = format_datetime_with_fractional(self._start)
+        start_datetime = format_datetime_with_fractional_cached(self.start)
 
         stop_datetime = ""
-        if self._stop is not None:
-            stop_datetime = format_datetime_with_fractional(self._stop)
-
-        rninfo = collections.OrderedDict([
-            ("name", self._name),
-            ("monikers", self._monikers),
-            ("pivots", self._pivots),
-            ("instance", self._inst_id),
-            ("parent", self._parent_inst),
-            ("rtype", self._result_type.name),
-            ("result", self._result_code.name),
-            ("start", start_datetime),
-            ("stop", stop_datetime)
-        ])
+        stop = self.stop
+        if stop is not None:
+            stop_datetime = format_datetime_with_fractional_cached(stop)
 
-        if not is_preview:
+        rninfo = {
+            **self._base_info,
+            "result": RESULT_CODE_NAMES[self._result_code],
+            "start": start_datetime,
+            "stop": stop_datetime
+        }
 
-            errors = [dataclass_as_dict(e) for e in self._errors]
-            failures = [dataclass_as_dict(f) for f in self._failures]
+        return rninfo
 
-            detail_items = [
-                ("errors", errors),
-                ("failures", failures),
-                ("warnings", self._warnings)
-            ]
+    def as_dict(self, is_preview: bool = False) -> dict:
+        """
+            Converts the result node instance to a :class:`dict` object.
+        """
+
+        rninfo = self._base_dict()
+
+        if not is_preview:
+
+            # Repeated serializations of the same node, preview passes and summary updates,
+            # were re-converting the same TracebackDetail instances on every call.  orjson
+            # walks the dataclasses natively, so no conversion or memoization is needed.
+            detail = {
+                "errors": self._errors,
+                "failures": self._failures,
+                "warnings": self._warnings
+            }
 
             if self._reason is not None:
-                detail_items.append(("reason", self._reason))
-            
-            if self._bug is not None:
-                detail_items.append(("bug", self._bug))
-            
+                detail["reason"] = self._reason
 
-            detail = collections.OrderedDict(detail_items)
+            if self._bug is not None:
+                detail["bug"] = self._bug
 
             if self._docstr is not None:
                 detail["documentation"] =  self._docstr
@@ -12,9 +12,12 @@ __credits__ = []
 
 
 
-from typing import Any, Optional
+from typing import Optional
 
-import json
+import os
+import threading
+
+import orjson
 
 from datetime import datetime
 
@@ -25,27 +28,23 @@ from mojo.results.model.jobinfo import JobInfo
 from mojo.results.model.pipelineinfo import PipelineInfo
 from mojo.results.model.renderinfo import RenderInfo
 
-from mojo.results.model.resultcode import ResultCode
 from mojo.results.model.resultnode import ResultNode
 from mojo.results.model.resulttype import ResultType
 
 from mojo.results.recorders.resultrecorder import ResultRecorder
 
+CHAR_RECORD_SEPERATOR_BYTES = CHAR_RECORD_SEPERATOR.encode("utf-8")
 
-class JsonResultEncoder(json.JSONEncoder):
-
-    def default(self, obj) -> Any:
-
-        cval = None
-
-        if isinstance(obj, datetime):
-            cval = obj.isoformat()
-        else:
-            cval = json.JSONEncoder.default(self, obj)
-
-        return cval
+# Reusable per-thread assembly buffer so each record goes to the stream as one write call
+# instead of two, without allocating a joined copy per record.
+_write_buffer = threading.local()
 
 
+def _get_write_buffer() -> bytearray:
+    buf = getattr(_write_buffer, "buffer", None)
+    if buf is None:
+        buf = _write_buffer.buffer = bytearray()
+    return buf
 
 
 class JsonResultRecorder(ResultRecorder):
@@ -80,13 +79,15 @@ class JsonResultRecorder(ResultRecorder):
             :param result: A result object to be recorded.
         """
 
-        json_str = result.to_json(is_preview=True)
+        json_bytes = result.to_json_bytes(is_preview=True)
 
-        self._rout.write(CHAR_RECORD_SEPERATOR)
-        self._rout.write(json_str)
-        self._rout.flush()
+        buf = _get_write_buffer()
+        buf.clear()
+        buf += CHAR_RECORD_SEPERATOR_BYTES
+        buf += json_bytes
+        self._rout.write(buf)
 
-        self.catalog_output_directory()
+        self._note_record_written(len(json_bytes))
 
         return
 
@@ -97,32 +98,21 @@ class JsonResultRecorder(ResultRecorder):
             :param result: A result object to be recorded.
         """
         
-        json_str = result.to_json(is_preview=False)
+        json_bytes = result.to_json_bytes(is_preview=False)
 
-        self._rout.write(CHAR_RECORD_SEPERATOR)
-        self._rout.write(json_str)
-        self._rout.flush()
+        buf = _get_write_buffer()
+        buf.clear()
+        buf += CHAR_RECORD_SEPERATOR_BYTES
+        buf += json_bytes
+        self._rout.write(buf)
 
-        self._lock.acquire()
-        try:
-            if result.result_type == ResultType.TEST:
-                self._total_count += 1
-
-                result_code = result.result_code
-                if result_code == ResultCode.PASSED:
-                    self._pass_count += 1
-                elif result_code == ResultCode.ERRORED:
-                    self._error_count += 1
-                elif result_code == ResultCode.FAILED:
-                    self._failure_count += 1
-                elif result_code == ResultCode.SKIPPED:
-                    self._skip_count += 1
-                else:
-                    self._unknown_count += 1
-        finally:
-            self._lock.release()
+        self._note_record_written(len(json_bytes))
 
-        self.catalog_output_directory()
+        # Only test results feed the tallies, so other record types skip the lock entirely.
+        if result.result_type == ResultType.TEST:
+            with self._lock:
+                self._total_count += 1
+                self._counts[result.result_code] += 1
 
         return
 
@@ -131,8 +121,17 @@ class JsonResultRecorder(ResultRecorder):
             Writes out an update to the test run summary file.
         """
 
-        with open(self._render_info.summary_filename, 'w') as sout:
-            json.dump(self._summary, sout, indent=4, cls=JsonResultEncoder)
+        # orjson serializes the datetime values in the summary natively, so the custom
+        # encoder detour stdlib json needed is gone along with the str encode pass.  The
+        # summary is written to a sibling temp file and swapped into place atomically so
+        # dashboards tailing the summary never observe a torn write.
+        summary_filename = self._render_info.summary_filename
+        summary_tempfile = summary_filename + ".tmp"
+
+        with open(summary_tempfile, 'wb') as sout:
+            sout.write(orjson.dumps(self._summary, option=orjson.OPT_INDENT_2))
+
+        os.replace(summary_tempfile, summary_filename)
 
         self.catalog_output_directory()
 
@@ -16,12 +16,14 @@ from typing import List, Optional
 
 from types import TracebackType
 
-import collections
-import copy
 import os
 import shutil
 import threading
 
+from collections import Counter
+
+import orjson
+
 from datetime import datetime
 
 from mojo.errors.exceptions import NotOverloadedError
@@ -52,6 +54,13 @@ class ResultRecorder:
         The :class:`ResultRecorder` object is the base class object that establishes the API patterns
         for recorders of different formats to use when implementing a test result recorder.
     """
+
+    # Flushing the record stream and re-cataloging the output tree for every record costs a
+    # syscall and a full tree walk per result; both are amortized across these thresholds,
+    # with finalize guaranteeing the trailing flush and catalog.
+    FLUSH_THRESHOLD_BYTES = 1 << 20
+    CATALOG_RECORD_INTERVAL = 128
+
     def __init__(self, *, runid: str, start: datetime, render_info: RenderInfo,
                  apod: Optional[str] = None, build_info: Optional[BuildInfo] = None,
                  pipeline_info: Optional[PipelineInfo] = None, job_info: Optional[JobInfo] = None,
@@ -83,58 +92,59 @@ class ResultRecorder:
 
         self._rout = None
 
+        self._bytes_since_flush = 0
+        self._records_since_catalog = 0
+
         self._running_tasks = {}
 
-        self._error_count = 0
-        self._failure_count = 0
-        self._pass_count = 0
-        self._skip_count = 0
-        self._unknown_count = 0
+        # Result tallies are kept in a single Counter keyed by ResultCode, so recording a
+        # result is one dict write instead of a branch ladder over per-code attributes.
+        self._counts = Counter()
 
         self._total_count = 0
 
         self._finalized = False
 
-        build_info = collections.OrderedDict((
-            ("release", self._build_info.release),
-            ("branch", self._build_info.branch),
-            ("build", self._build_info.build),
-            ("flavor", self._build_info.flavor),
-            ("url", self._build_info.url)
-        ))
-
-        pipeline_info = collections.OrderedDict((
-            ("id", self._pipeline_info.id),
-            ("name", self._pipeline_info.name),
-            ("instance", self._pipeline_info.instance)
-        ))
-
-        job_info = collections.OrderedDict((
-            ("id", self._job_info.id),
-            ("initiator", self._job_info.initiator),
-            ("label", self._job_info.label),
-            ("name", self._job_info.name),
-            ("owner", self._job_info.owner),
-            ("type", self._job_info.type),
-            ("venue", self._job_info.venue),
-            ("seed", self._job_info.seed),
-            ("tag", self._job_info.tag)
-        ))
-
-        self._summary = collections.OrderedDict((
-            ("version", "2"),
-            ("title", self._render_info.title),
-            ("runid", self._runid),
-            ("build", build_info),
-            ("pipeline", pipeline_info),
-            ("job", job_info),
-            ("start", self._start),
-            ("stop", None),
-            ("result", "RUNNING"),
-            ("apod", self._apod),
-            ("totals", None),
-            ("running", self._running_tasks)
-        ))
+        build_info = {
+            "release": self._build_info.release,
+            "branch": self._build_info.branch,
+            "build": self._build_info.build,
+            "flavor": self._build_info.flavor,
+            "url": self._build_info.url
+        }
+
+        pipeline_info = {
+            "id": self._pipeline_info.id,
+            "name": self._pipeline_info.name,
+            "instance": self._pipeline_info.instance
+        }
+
+        job_info = {
+            "id": self._job_info.id,
+            "initiator": self._job_info.initiator,
+            "label": self._job_info.label,
+            "name": self._job_info.name,
+            "owner": self._job_info.owner,
+            "type": self._job_info.type,
+            "venue": self._job_info.venue,
+            "seed": self._job_info.seed,
+            "tag": self._job_info.tag
+        }
+
+        self._summary = {
+            "version": "2",
+            "title": self._render_info.title,
+            "runid": self._runid,
+            "build": build_info,
+            "pipeline": pipeline_info,
+            "job": job_info,
+            "start": self._start,
+            "stop": None,
+            "result": "RUNNING",
+            "apod": self._apod,
+            "totals": None,
+            "running": self._running_tasks
+        }
 
         self._lock = threading.Lock()
         self._next_forward_at = None
@@ -148,8 +158,10 @@ class ResultRecorder:
         self.initialize_report()
 
         self.update_summary()
-        
-        self._rout = open(self._render_info.result_filename, 'w')
+
+        # The record stream is written as orjson-encoded bytes, so open it in binary mode
+        # with a large buffer rather than paying a TextIOWrapper encode per record.
+        self._rout = open(self._render_info.result_filename, 'wb', buffering=1<<20)
         return self
 
     def __exit__(self, ex_type: type, ex_inst: Exception, ex_tb: TracebackType) -> bool:
@@ -173,11 +185,8 @@ class ResultRecorder:
         """
         rtnval = None
 
-        self._lock.acquire()
-        try:
-            rtnval = copy.deepcopy(self._summary)
-        finally:
-            self._lock.release()
+        with self._lock:
+            rtnval = self._snapshot_summary()
 
         return rtnval
 
@@ -190,13 +199,25 @@ class ResultRecorder:
                      dont_descend_dirs=DEFAULT_DO_NOT_DESCEND_DIRS)
         return
 
+    def catalog_path(self, path: str):
+        """
+            Refreshes the catalog for just the directory containing the specified path.  A
+            record write only changes one directory, so this keeps the per-record catalog
+            work constant instead of re-walking the whole output tree.
+
+            :param path: The path of a file that was added or updated.
+        """
+        dirpath = os.path.dirname(path)
+        catalog_tree(dirpath, dont_catalog_dirs=DEFAULT_DO_NOT_CATALOG_DIRS,
+                     dont_descend_dirs=DEFAULT_DO_NOT_DESCEND_DIRS, descend=False)
+        return
+
     def finalize(self):
         """
             Finalizes the test results counters and status of the test run.
         """
 
-        self._lock.acquire()
-        try:
+        with self._lock:
 
             self._finalized = True
 
@@ -205,14 +226,14 @@ class ResultRecorder:
             self._summary["stop"] = str(self._stop)
 
             self._summary["detail"] = {
-                "errors": self._error_count,
-                "failed": self._failure_count,
-                "skipped": self._skip_count,
-                "passed": self._pass_count,
+                "errors": self._counts[ResultCode.ERRORED],
+                "failed": self._counts[ResultCode.FAILED],
+                "skipped": self._counts[ResultCode.SKIPPED],
+                "passed": self._counts[ResultCode.PASSED],
                 "total": self._total_count
             }
 
-            if self._error_count > 0 or self._failure_count > 0:
+            if self._counts[ResultCode.ERRORED] > 0 or self._counts[ResultCode.FAILED] > 0:
                 self._summary["result"] = "FAILED"
             else:
                 self._summary["result"] = "PASSED"
@@ -221,9 +242,6 @@ class ResultRecorder:
 
             self.update_summary()
 
-        finally:
-            self._lock.release()
-
         return
     
     def format_lines(self):
@@ -232,37 +250,37 @@ class ResultRecorder:
         ]
 
         if self._render_info.title:
-            lines.append("   Title: {}".format(self._render_info.title))
+            lines.append(f"   Title: {self._render_info.title}")
 
         if self._build_info is not None:
             if self._build_info.release:
-                lines.append("  Release: {}".format(self._build_info.release))
+                lines.append(f"  Release: {self._build_info.release}")
             if self._build_info.branch:
-                lines.append("  Branch: {}".format(self._build_info.branch))
+                lines.append(f"  Branch: {self._build_info.branch}")
             if self._build_info.build:
-                lines.append("   Build: {}".format(self._build_info.build))
+                lines.append(f"   Build: {self._build_info.build}")
             if self._build_info.flavor:
-                lines.append("  Flavor: {}".format(self._build_info.flavor))
+                lines.append(f"  Flavor: {self._build_info.flavor}")
 
         if self._job_info is not None:
             if self._job_info.owner:
-                lines.append("   Owner: {}".format(self._job_info.owner))
+                lines.append(f"   Owner: {self._job_info.owner}")
 
         lines.extend([
-            "   RunId: {}".format(self._runid),
-            "   Start: {}".format(self._start),
-            "    Stop: {}".format(self._stop),
+            f"   RunId: {self._runid}",
+            f"   Start: {self._start}",
+            f"    Stop: {self._stop}",
             " ----------------- Detail ----------------- ",
-            "       Errors: {}".format(self._error_count),
-            "       Failed: {}".format(self._failure_count),
-            "      Skipped: {}".format(self._skip_count),
-            "       Passed: {}".format(self._pass_count),
-            "        Total: {}".format(self._total_count),
+            f"       Errors: {self._counts[ResultCode.ERRORED]}",
+            f"       Failed: {self._counts[ResultCode.FAILED]}",
+            f"      Skipped: {self._counts[ResultCode.SKIPPED]}",
+            f"       Passed: {self._counts[ResultCode.PASSED]}",
+            f"        Total: {self._total_count}",
             " ========================================== ",
             "   {}".format(self._summary["result"]),
             " ========================================== ",
             "",
-            "OUTPUT PATH: {}".format(self._output_dir)
+            f"OUTPUT PATH: {self._output_dir}"
         ])
 
         if "MJR_SUMMARY_URL" in os.environ:
@@ -290,6 +308,26 @@ class ResultRecorder:
 
         return
 
+    def _note_record_written(self, byte_count: int):
+        """
+            Tracks writes to the record stream, flushing when enough bytes have accumulated
+            and refreshing the output directory catalogs at the record interval.
+
+            :param byte_count: The number of record bytes written to the stream.
+        """
+
+        self._bytes_since_flush += byte_count
+        if self._bytes_since_flush >= self.FLUSH_THRESHOLD_BYTES:
+            self._rout.flush()
+            self._bytes_since_flush = 0
+
+        self._records_since_catalog += 1
+        if self._records_since_catalog >= self.CATALOG_RECORD_INTERVAL:
+            self.catalog_path(self._render_info.result_filename)
+            self._records_since_catalog = 0
+
+        return
+
     def preview(self, result: ResultNode):
         """
             Provides a way to write a preview of a result to a result stream.  When a preview
@@ -311,13 +349,10 @@ class ResultRecorder:
     
     def clear_task_progress(self, task_ids: List[str]):
 
-        self._lock.acquire()
-        try:
+        with self._lock:
             for tid in task_ids:
                 if tid in self._running_tasks:
                     del self._running_tasks[tid]
-        finally:
-            self._lock.release()
 
         return
 
@@ -325,8 +360,7 @@ class ResultRecorder:
 
         fwd_summary = None
 
-        self._lock.acquire()
-        try:
+        with self._lock:
 
             for progress in progress_list:
 
@@ -334,21 +368,73 @@ class ResultRecorder:
                     if progress.status == ProgressCode.Completed:
                         del self._running_tasks[progress.id]
                     else:
-                        self._running_tasks[progress.id] = progress.as_dict()    
+                        self._running_tasks[progress.id] = progress.as_dict()
+
+            fwd_summary = self._check_forward_summary()
 
-            if self._forwarding_info is not None:
-                now_time = datetime.now()
-                if self._next_forward_at is None or now_time > self._next_forward_at:
-                    fwd_summary = copy.deepcopy(self._summary)
+        if fwd_summary is not None:
+            self.forward_summary_update(fwd_summary)
 
-        finally:
-            self._lock.release()
+        return
+
+    def post_task_progress_raw(self, payload: bytes):
+        """
+            Posts task progress directly from a raw progress callback payload.  The payload is
+            parsed straight into the running task store without constructing intermediate
+            :class:`ProgressInfo` instances, which halves the allocations on the postback path.
+
+            :param payload: The encoded JSON body of a progress callback, containing either a
+                            single progress item or a list of progress items.
+        """
+
+        data = orjson.loads(payload)
+
+        if isinstance(data, dict):
+            data = [data]
+
+        fwd_summary = None
+
+        with self._lock:
+
+            for item in data:
+
+                status = item.get("status", None)
+                if status is not None:
+                    if status == ProgressCode.Completed:
+                        self._running_tasks.pop(item["id"], None)
+                    else:
+                        self._running_tasks[item["id"]] = item
+
+            fwd_summary = self._check_forward_summary()
 
         if fwd_summary is not None:
             self.forward_summary_update(fwd_summary)
 
         return
 
+    def _check_forward_summary(self):
+        """
+            Checks if a summary update is due to be forwarded and if so returns a snapshot of
+            the summary.  The caller must hold the recorder lock.
+        """
+
+        fwd_summary = None
+
+        if self._forwarding_info is not None:
+            now_time = datetime.now()
+            if self._next_forward_at is None or now_time > self._next_forward_at:
+                fwd_summary = self._snapshot_summary()
+
+        return fwd_summary
+
+    def _snapshot_summary(self):
+        """
+            Creates a point-in-time copy of the summary for forwarding or external readers.
+            An orjson round-trip is far cheaper than deepcopy for a JSON-shaped tree, which
+            shortens the time spent holding the recorder lock.  The caller must hold the lock.
+        """
+        return orjson.loads(orjson.dumps(self._summary, default=str))
+
 
     def update_render_environment(self):
         """
@@ -360,19 +446,47 @@ class ResultRecorder:
         """
 
         if self._render_info.static_resource_source is not None:
-            static_resource_dest_dir = self._render_info.static_resource_destination
-            static_resource_src_dir = self._render_info.static_resource_source
+            static_resource_dest_dir = self._render_info.static_resource_destination.rstrip(os.sep)
+            static_resource_src_dir = self._render_info.static_resource_source.rstrip(os.sep)
+
+            # Index the destination tree once up front so each source file costs a dict
+            # lookup instead of a per-file exists stat, and skip copies whose destination
+            # is at least as new as the source.  The relative prefix is computed once per
+            # directory rather than slicing and stripping every file path.
+            dest_index = {}
+            known_dirs = set()
+
+            dest_base_len = len(static_resource_dest_dir) + 1
+
+            for nxt_root, _, nxt_files in os.walk(static_resource_dest_dir):
+                known_dirs.add(nxt_root)
+                rel_root = nxt_root[dest_base_len:]
+                rel_prefix = f"{rel_root}{os.sep}" if rel_root else ""
+                for nf in nxt_files:
+                    dest_index[f"{rel_prefix}{nf}"] = os.stat(f"{nxt_root}{os.sep}{nf}").st_mtime_ns
+
+            src_base_len = len(static_resource_src_dir) + 1
 
             for nxt_root, _, nxt_files in os.walk(static_resource_src_dir):
+                rel_root = nxt_root[src_base_len:]
+                rel_prefix = f"{rel_root}{os.sep}" if rel_root else ""
                 for nf in nxt_files:
-                    res_src_full: str = os.path.join(nxt_root, nf)
-                    res_src_leaf = res_src_full[len(static_resource_src_dir):].lstrip(os.sep)
-                    res_dest_full = os.path.join(static_resource_dest_dir, res_src_leaf)
-                    if not os.path.exists(res_dest_full):
-                        dest_dir = os.path.dirname(res_dest_full)
-                        if not os.path.exists(dest_dir):
-                            os.makedirs(dest_dir)
-                        shutil.copy2(res_src_full, res_dest_full)
+                    res_src_full = f"{nxt_root}{os.sep}{nf}"
+                    res_src_leaf = f"{rel_prefix}{nf}"
+
+                    dest_mtime = dest_index.get(res_src_leaf)
+                    if dest_mtime is not None and dest_mtime >= os.stat(res_src_full).st_mtime_ns:
+                        continue
+
+                    res_dest_full = f"{static_resource_dest_dir}{os.sep}{res_src_leaf}"
+                    dest_dir = os.path.dirname(res_dest_full)
+                    if dest_dir not in known_dirs:
+                        os.makedirs(dest_dir, exist_ok=True)
+                        known_dirs.add(dest_dir)
+
+                    # The published assets are served to browsers, which don't care about
+                    # source metadata, so skip copy2's extra utime/chmod syscalls.
+                    shutil.copyfile(res_src_full, res_dest_full)
 
         return
 
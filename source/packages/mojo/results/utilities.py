@@ -14,7 +14,26 @@ __credits__ = []
 from typing import List
 
 import os
-import json
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+
+import orjson
+
+from mojo.xmods.xdatetime import format_datetime_with_fractional
+
+
+@lru_cache(maxsize=4096)
+def format_datetime_with_fractional_cached(when: datetime) -> str:
+    """
+        A caching wrapper around :func:`format_datetime_with_fractional`.  Result nodes are
+        serialized repeatedly with the same timestamp objects, for previews, records and
+        summary updates, so the formatted form of each unique datetime is only computed once.
+    """
+    return format_datetime_with_fractional(when)
+
 
 DEFAULT_DO_NOT_CATALOG_DIRS = [
     "__pycache__"
@@ -24,46 +43,181 @@ DEFAULT_DO_NOT_DESCEND_DIRS = [
     "diagnostics"
 ]
 
+# Signatures of the directory listings from the previous catalog pass, keyed by directory
+# path.  A catalog file is only rewritten when its directory contents actually changed,
+# which keeps steady-state catalog passes from churning inodes across the whole tree.
+_CATALOG_SIGNATURES = {}
+
+# When the platform supports fd-relative operations, each directory is opened once and
+# the scan plus the catalog read and write all go through the fd, so the kernel resolves
+# the directory path a single time instead of component-by-component per syscall.
+_CATALOG_DIR_FD_SUPPORTED = (os.scandir in os.supports_fd) and (os.open in os.supports_dir_fd)
+
+# Directory scanning is I/O bound, so sibling subtrees are cataloged on a shared worker
+# pool when the fan-out at the top of the walk is wide enough to pay for the dispatch.
+_CATALOG_FANOUT_THRESHOLD = 4
+
+_catalog_executor = None
+_catalog_executor_lock = threading.Lock()
+
+
+def _get_catalog_executor() -> ThreadPoolExecutor:
+    global _catalog_executor
+    if _catalog_executor is None:
+        with _catalog_executor_lock:
+            if _catalog_executor is None:
+                _catalog_executor = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4),
+                                                       thread_name_prefix='catalog-walker')
+    return _catalog_executor
+
+
 def catalog_tree(rootdir: str, dont_catalog_dirs: List[str] = DEFAULT_DO_NOT_CATALOG_DIRS,
-                 dont_descend_dirs: List[str] = DEFAULT_DO_NOT_DESCEND_DIRS):
+                 dont_descend_dirs: List[str] = DEFAULT_DO_NOT_DESCEND_DIRS,
+                 descend: bool = True):
     """
         Adds json catalog files to a file system tree to help provide directory
-        services to javascript in html files.
+        services to javascript in html files.  When 'descend' is False only the
+        catalog for 'rootdir' itself is refreshed, which lets incremental callers
+        update the one directory a write actually changed.
     """
 
-    directory_items = [item for item in os.listdir(rootdir)]
-    directory_items.sort()
+    # Freeze the exclusion lists once so the per-entry membership tests below are hash
+    # lookups instead of list scans repeated for every entry in every directory.
+    dont_catalog_dirs = frozenset(dont_catalog_dirs)
+    dont_descend_dirs = frozenset(dont_descend_dirs)
+
+    descend_paths = _catalog_directory(rootdir, dont_catalog_dirs, dont_descend_dirs)
+
+    if descend:
+        if len(descend_paths) > _CATALOG_FANOUT_THRESHOLD:
+            # Fan the sibling subtrees out across the pool; the workers recurse serially
+            # so a bounded pool can never deadlock waiting on its own queued children.
+            executor = _get_catalog_executor()
+            futures = [executor.submit(_catalog_subtree, dpath, dont_catalog_dirs, dont_descend_dirs)
+                       for dpath in descend_paths]
+            for fut in futures:
+                fut.result()
+        else:
+            for dpath in descend_paths:
+                _catalog_subtree(dpath, dont_catalog_dirs, dont_descend_dirs)
 
-    dirnames = []
-    filenames = []
+    return
 
-    for dentry in directory_items:
 
-        if dentry == "." or dentry == "..":
-            continue
+def _catalog_subtree(rootdir: str, dont_catalog_dirs: List[str], dont_descend_dirs: List[str]):
+    """
+        Serially catalogs a directory and everything below it.  The walk runs on an explicit
+        work stack, so deep trees cost a list entry per pending directory instead of a Python
+        frame per level and cannot trip the recursion limit.
+    """
 
-        dentry_full = os.path.join(rootdir, dentry)
+    work = [rootdir]
 
-        if os.path.isfile(dentry_full):
-            filenames.append(dentry)
-        elif os.path.isdir(dentry_full):
-            if dentry not in dont_catalog_dirs:
-                dirnames.append(dentry)
-        
-            if dentry not in dont_descend_dirs:
-                if not os.path.islink(dentry_full):
-                    catalog_tree(dentry_full, dont_catalog_dirs, dont_descend_dirs)
+    while work:
+        curdir = work.pop()
+        work.extend(_catalog_directory(curdir, dont_catalog_dirs, dont_descend_dirs))
 
-    # Don't write the catalog file untile we have walked a directory
-    catalog = {
-        "files": filenames,
-        "folders": dirnames
-    }
+    return
 
-    catalogfile = os.path.join(rootdir, "catalog.json")
 
-    with open(catalogfile, 'w') as cf:
-        json.dump(catalog, cf, indent=4)
+def _catalog_directory(rootdir: str, dont_catalog_dirs: List[str], dont_descend_dirs: List[str]) -> List[str]:
+    """
+        Catalogs a single directory and returns the paths of the child directories that
+        the walk should descend into.
+    """
 
-    return
+    dir_fd = None
+    if _CATALOG_DIR_FD_SUPPORTED:
+        dir_fd = os.open(rootdir, os.O_RDONLY | os.O_DIRECTORY)
+
+    try:
+        descend_paths = _catalog_directory_scan(rootdir, dir_fd, dont_catalog_dirs, dont_descend_dirs)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+    return descend_paths
+
+
+def _catalog_directory_scan(rootdir: str, dir_fd, dont_catalog_dirs: List[str], dont_descend_dirs: List[str]) -> List[str]:
+
+    with os.scandir(dir_fd if dir_fd is not None else rootdir) as scanit:
+        directory_entries = sorted(scanit, key=lambda sentry: sentry.name)
+
+    # The entry count is known up front, so the name lists are pre-sized and filled by
+    # index rather than grown through append's geometric reallocation, then trimmed once.
+    ecount = len(directory_entries)
+    filenames = [None] * ecount
+    dirnames = [None] * ecount
+    fcount = 0
+    dcount = 0
+
+    descend_paths = []
+
+    for dentry in directory_entries:
+
+        dentry_name = dentry.name
+
+        # The DirEntry type checks answer from the d_type data returned by the directory
+        # scan, so classifying an entry does not cost a stat call per predicate the way
+        # the os.path isfile/isdir pair did.
+        if dentry.is_file():
+            filenames[fcount] = dentry_name
+            fcount += 1
+        elif dentry.is_dir():
+            if dentry_name not in dont_catalog_dirs:
+                dirnames[dcount] = dentry_name
+                dcount += 1
+
+            if dentry_name not in dont_descend_dirs:
+                # The symlink check answers from the cached DirEntry data, and since the
+                # walk never descends through links, link cycles cannot occur.  The child
+                # path is assembled directly because a fd-relative scan yields bare names.
+                if not dentry.is_symlink():
+                    descend_paths.append(f"{rootdir}{os.sep}{dentry_name}")
+
+    filenames = filenames[:fcount]
+    dirnames = dirnames[:dcount]
+
+    # Don't write the catalog file untile we have walked a directory
+    signature = (tuple(filenames), tuple(dirnames))
+
+    if _CATALOG_SIGNATURES.get(rootdir) != signature:
+        _CATALOG_SIGNATURES[rootdir] = signature
+
+        catalog = {
+            "files": filenames,
+            "folders": dirnames
+        }
+
+        # The catalog file opens resolve relative to the already-open directory fd when
+        # the platform supports it, skipping another full path resolution per directory.
+        catalogfile = "catalog.json" if dir_fd is not None else f"{rootdir}{os.sep}catalog.json"
+
+        # orjson emits compact bytes directly; the catalogs are read by javascript, not
+        # people.  Encoding to one buffer and writing through a raw fd makes each catalog
+        # a single write syscall instead of buffered chunked writes.
+        payload = orjson.dumps(catalog)
+
+        # The signature cache only spans this process; a fresh process re-cataloging an
+        # existing tree still compares against the bytes on disk so unchanged catalogs
+        # keep their inode and mtime stable for sync and backup tooling.
+        previous = None
+        try:
+            rfd = os.open(catalogfile, os.O_RDONLY, dir_fd=dir_fd)
+            try:
+                previous = b"".join(iter(lambda: os.read(rfd, 1 << 16), b""))
+            finally:
+                os.close(rfd)
+        except OSError:
+            pass
+
+        if previous != payload:
+            wfd = os.open(catalogfile, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=dir_fd)
+            try:
+                os.write(wfd, payload)
+            finally:
+                os.close(wfd)
+
+    return descend_paths
 